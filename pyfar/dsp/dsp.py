@@ -1,3 +1,4 @@
+import functools
 import multiprocessing
 import numpy as np
 from scipy import signal as sgn
@@ -42,7 +43,8 @@ def phase(signal, deg=False, unwrap=False):
         phase = wrap_to_2pi(np.unwrap(phase))
 
     if deg:
-        phase = np.degrees(phase)
+        # phase is a new array in any case and can be converted in place
+        np.degrees(phase, out=phase)
     return phase
 
 
@@ -251,7 +253,7 @@ def spectrogram(signal, window='hann', window_length=1024,
                 window_overlap_fct=0.5, normalize=True):
     """Compute the magnitude spectrum versus time.
 
-    This is a wrapper for ``scipy.signal.spectogram`` with two differences.
+    The result matches ``scipy.signal.spectogram`` with two differences.
     First, the returned times refer to the start of the FFT blocks, i.e., the
     first time is always 0 whereas it is window_length/2 in scipy. Second, the
     returned spectrogram is normalized according to ``signal.fft_norm`` if the
@@ -292,16 +294,32 @@ def spectrogram(signal, window='hann', window_length=1024,
     if not isinstance(normalize, bool):
         raise TypeError("The normalize parameter needs to be boolean")
 
-    # get spectrogram from scipy.signal
-    window_overlap = int(window_length * window_overlap_fct)
-    window = sgn.get_window(window, window_length)
+    from scipy.fft import rfft
 
-    frequencies, times, spectrogram = sgn.spectrogram(
-        x=signal.time.squeeze(), fs=signal.sampling_rate, window=window,
-        noverlap=window_overlap, mode='magnitude', scaling='spectrum')
-
-    # remove normalization from scipy.signal.spectrogram
-    spectrogram /= np.sqrt(1 / window.sum()**2)
+    window_overlap = int(window_length * window_overlap_fct)
+    if window_overlap >= window_length:
+        raise ValueError("window_overlap_fct must be smaller than 1")
+    window = _get_window(window, window_length)
+    hop = window_length - window_overlap
+
+    # view on the time data with one block per row (does not copy the data)
+    blocks = np.lib.stride_tricks.sliding_window_view(
+        signal.time.squeeze(), window_length, axis=-1)[..., ::hop, :]
+
+    # remove the mean (default detrending of scipy.signal.spectrogram) and
+    # apply the window in place on the only copy of the blocks
+    blocks = blocks - np.mean(blocks, axis=-1, keepdims=True)
+    blocks *= window
+
+    # transform all blocks at once and move the frequency axis before the
+    # time axis
+    spectrogram = np.abs(rfft(
+        blocks, axis=-1, workers=multiprocessing.cpu_count()))
+    spectrogram = np.moveaxis(spectrogram, -1, -2)
+
+    frequencies = fft.rfftfreq(window_length, signal.sampling_rate)
+    # the times refer to the beginning of the blocks
+    times = np.arange(spectrogram.shape[-1]) * hop / signal.sampling_rate
 
     # apply normalization from signal
     if normalize:
@@ -309,13 +327,34 @@ def spectrogram(signal, window='hann', window_length=1024,
             spectrogram, window_length, signal.sampling_rate,
             signal.fft_norm, window=window)
 
-    # scipy.signal takes the center of the DFT blocks as time stamp we take the
-    # beginning (looks nicer in plots, both conventions are used)
-    times -= times[0]
-
     return frequencies, times, spectrogram
 
 
+def _get_window(window, window_length):
+    """
+    Cached version of ``scipy.signal.get_window``.
+
+    The window is read-only because it is shared between all calls with the
+    same parameters. Window specifications that can not be hashed are passed
+    to ``scipy.signal.get_window`` without caching.
+    """
+    try:
+        hash(window)
+    except TypeError:
+        # window specification that can not be cached
+        return sgn.get_window(window, window_length)
+
+    return _get_cached_window(window, window_length)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_cached_window(window, window_length):
+    """Return a read-only window from ``scipy.signal.get_window``."""
+    window = sgn.get_window(window, window_length)
+    window.flags.writeable = False
+    return window
+
+
 def time_window(signal, interval, window='hann', shape='symmetric',
                 unit='samples', crop='none', return_window=False):
     """Apply time window to signal.
@@ -1747,21 +1786,21 @@ def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
             log_prefix = 20
     if domain == 'freq':
         if isinstance(signal, (pyfar.FrequencyData, pyfar.Signal)):
-            data = signal.freq.copy()
+            data = np.abs(signal.freq)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
                 " but must be of type 'Signal' or 'FrequencyData'.")
     elif domain == 'time':
         if isinstance(signal, (pyfar.TimeData, pyfar.Signal)):
-            data = signal.time.copy()
+            data = np.abs(signal.time)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
                 " but must be of type 'Signal' or 'TimeData'.")
     elif domain == 'freq_raw':
         if isinstance(signal, (pyfar.Signal)):
-            data = signal.freq_raw.copy()
+            data = np.abs(signal.freq_raw)
         else:
             raise ValueError(
                 f"Domain is '{domain}' and signal is type '{signal.__class__}'"
@@ -1770,11 +1809,17 @@ def decibel(signal, domain='freq', log_prefix=None, log_reference=1,
         raise ValueError(
             f"Domain is '{domain}', but has to be 'time', 'freq',"
             " or 'freq_raw'.")
+    # data holds the magnitude, i.e., a new real valued array. Compute
+    # log_prefix * log10(data / log_reference) in place to avoid allocating an
+    # array for each intermediate step
     data[data == 0] = np.finfo(float).eps
+    data /= log_reference
+    np.log10(data, out=data)
+    data *= log_prefix
     if return_prefix is True:
-        return log_prefix * np.log10(np.abs(data) / log_reference), log_prefix
+        return data, log_prefix
     else:
-        return log_prefix * np.log10(np.abs(data) / log_reference)
+        return data
 
 
 def energy(signal):
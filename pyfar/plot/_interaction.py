@@ -47,9 +47,9 @@ be done this way
 >>> ax[0].interaction.select_action(EventEmu('Y'))
 
 """
+import functools
 import numpy as np
 import matplotlib as mpl
-import matplotlib.pyplot as plt
 from pyfar.plot import utils
 from pyfar.plot import _line
 from pyfar.plot import _two_d
@@ -137,6 +137,7 @@ class PlotParameter(object):
                  xscale='log', yscale='linear',            # axis scaling
                  deg=False, unwrap=False,                  # phase properties
                  unit_time='s',                            # time axis unit
+                 decimate=False,                           # time data
                  unit_gd='s',                              # group delay unit
                  window='hann', window_length=1014,        # spectrogram
                  window_overlap_fct=.5,
@@ -160,6 +161,7 @@ class PlotParameter(object):
         self.deg = deg
         self.unwrap = unwrap
         self.unit_time = unit_time
+        self.decimate = decimate
         self.unit_gd = unit_gd
         self.window = window
         self.window_length = window_length
@@ -504,6 +506,28 @@ class PlotParameter(object):
         return cm_type
 
 
+@functools.lru_cache(maxsize=None)
+def _shortcut_keys():
+    """
+    Return the keyboard shortcuts used by Interaction.
+
+    The shortcuts are only read once and shared between all Interaction
+    instances. They must not be modified.
+    """
+
+    keys = utils.shortcuts(False)
+    # get control shortcuts (we don't need the 'info' field here)
+    ctr = keys["controls"]
+    for c in ctr:
+        ctr[c] = ctr[c]["key"]
+    # get plot shortcuts (we don't need the 'info' field here)
+    plot = keys["plots"]
+    for p in plot:
+        plot[p] = plot[p]["key"]
+
+    return keys
+
+
 class Interaction(object):
     """Change the plot and plot parameters based on keyboard shortcuts.
 
@@ -561,15 +585,9 @@ class Interaction(object):
         self.txt = None
 
         # get keyboard shortcuts
-        self.keys = utils.shortcuts(False)
-        # get control shortcuts (we don't need the 'info' field here)
+        self.keys = _shortcut_keys()
         self.ctr = self.keys["controls"]
-        for ctr in self.ctr:
-            self.ctr[ctr] = self.ctr[ctr]["key"]
-        # get plot shortcuts (we don't need the 'info' field here)
         self.plot = self.keys["plots"]
-        for plot in self.plot:
-            self.plot[plot] = self.plot[plot]["key"]
 
         # connect to Matplotlib
         self.connect()
@@ -688,7 +706,7 @@ class Interaction(object):
             return
 
         # prepare for toggling
-        with plt.style.context(utils.plotstyle(self.style)):
+        with utils._style_context(self.style):
             self.figure.clear()
             # This saves the axis used for interaction
             self.ax = None
@@ -708,7 +726,7 @@ class Interaction(object):
                     self.all_axes = self.ax = _line._time(
                         self.signal, prm.dB_time, prm.log_prefix_time,
                         prm.log_reference, prm.unit_time, self.ax,
-                        **self.kwargs_line)
+                        prm.decimate, **self.kwargs_line)
                 elif self.params.plot_type == "2d":
                     self.params.update('time_2d')
                     self.all_axes, _, self.all_bars = _two_d._time_2d(
@@ -969,7 +987,7 @@ class Interaction(object):
         y_pos = .02
 
         # write new text
-        with plt.style.context(utils.plotstyle(self.style)):
+        with utils._style_context(self.style):
             bbox = dict(boxstyle="round", fc=mpl.rcParams["axes.facecolor"],
                         ec=mpl.rcParams["axes.facecolor"], alpha=.5)
 
@@ -987,7 +1005,7 @@ class Interaction(object):
             self.draw_canvas()
 
     def draw_canvas(self):
-        with plt.style.context(utils.plotstyle(self.style)):
+        with utils._style_context(self.style):
             self.figure.canvas.draw()
 
     def connect(self):
@@ -1064,3 +1082,23 @@ def get_new_axis_limits(limits, axis_type, operation, direction, amount=.1):
     new_limits = limits + shift
 
     return new_limits
+
+
+def _plot_with_interaction(plot_function, signal, style, plot_parameter,
+                           *args, **kwargs):
+    """
+    Plot the flattened `signal` and attach an Interaction to the axes.
+
+    `args` are passed to `plot_function` after the signal. `kwargs` are passed
+    to `plot_function` and the Interaction. The Interaction is attached to the
+    first axis if `plot_function` creates multiple axes.
+    """
+
+    with utils._style_context(style):
+        ax = plot_function(signal.flatten(), *args, **kwargs)
+
+    interaction = Interaction(
+        signal, ax, None, style, plot_parameter, **kwargs)
+    interaction.ax.interaction = interaction
+
+    return ax
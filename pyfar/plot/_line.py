@@ -11,7 +11,7 @@ from matplotlib.ticker import NullFormatter
 
 
 def _time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
-          ax=None, **kwargs):
+          ax=None, decimate=False, **kwargs):
     """Plot the time data of a signal."""
 
     # check input
@@ -49,6 +49,12 @@ def _time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
     _utils._set_axlim(ax, ax.set_xlim, times[0], times[-1],
                       ax.get_xlim())
 
+    # reduce the data to the number of horizontal pixels of the axis
+    if decimate:
+        n_bins = int(np.ceil(ax.bbox.width))
+        if times.size > 4 * n_bins:
+            times, data = _utils._min_max_decimation(times, data, n_bins)
+
     # plot data
     ax.plot(times, data, **kwargs)
 
@@ -69,6 +75,7 @@ def _freq(signal, dB=True, log_prefix=None, log_reference=1, freq_scale='log',
 
     # prepare input
     kwargs = _utils._return_default_colors_rgb(**kwargs)
+    frequencies = signal.frequencies
     if dB:
         data = dsp.decibel(signal, 'freq', log_prefix, log_reference)
         ymax = np.nanmax(data)
@@ -86,14 +93,15 @@ def _freq(signal, dB=True, log_prefix=None, log_reference=1, freq_scale='log',
     else:
         ax.set_ylabel("Magnitude")
     ax.set_xlabel("Frequency in Hz")
-    _utils._set_axlim(ax, ax.set_xlim, _utils._lower_frequency_limit(signal),
-                      signal.frequencies[-1], ax.get_xlim())
+    _utils._set_axlim(ax, ax.set_xlim,
+                      _utils._lower_frequency_limit(signal, frequencies),
+                      frequencies[-1], ax.get_xlim())
 
     # plot data
     if freq_scale == 'log':
-        ax.semilogx(signal.frequencies, data.T, **kwargs)
+        ax.semilogx(frequencies, data.T, **kwargs)
     else:
-        ax.plot(signal.frequencies, data.T, **kwargs)
+        ax.plot(frequencies, data.T, **kwargs)
 
     # set and format ticks
     if freq_scale == 'log':
@@ -119,6 +127,7 @@ def _phase(signal, deg=False, unwrap=False, freq_scale='log', ax=None,
 
     # prepare input
     kwargs = _utils._return_default_colors_rgb(**kwargs)
+    frequencies = signal.frequencies
     phase_data = dsp.phase(signal, deg=deg, unwrap=unwrap)
 
     # Construct the correct label string
@@ -141,15 +150,16 @@ def _phase(signal, deg=False, unwrap=False, freq_scale='log', ax=None,
     ax.set_xlabel("Frequency in Hz")
     ax.set_ylabel(ylabel_string)
     ax.grid(True, 'both')
-    _utils._set_axlim(ax, ax.set_xlim, _utils._lower_frequency_limit(signal),
-                      signal.frequencies[-1], ax.get_xlim())
+    _utils._set_axlim(ax, ax.set_xlim,
+                      _utils._lower_frequency_limit(signal, frequencies),
+                      frequencies[-1], ax.get_xlim())
     _utils._set_axlim(ax, ax.set_ylim, ymin, ymax, ax.get_ylim())
 
     # plot data
     if freq_scale == 'log':
-        ax.semilogx(signal.frequencies, phase_data.T, **kwargs)
+        ax.semilogx(frequencies, phase_data.T, **kwargs)
     else:
-        ax.plot(signal.frequencies, phase_data.T, **kwargs)
+        ax.plot(frequencies, phase_data.T, **kwargs)
 
     # set and format ticks
     if freq_scale == 'log':
@@ -171,6 +181,7 @@ def _group_delay(signal, unit="s", freq_scale='log', ax=None, **kwargs):
 
     # prepare input
     kwargs = _utils._return_default_colors_rgb(**kwargs)
+    frequencies = signal.frequencies
     data = dsp.group_delay(signal)
     # auto detect the unit
     if unit in [None, "auto"]:
@@ -186,16 +197,17 @@ def _group_delay(signal, unit="s", freq_scale='log', ax=None, **kwargs):
     ax.set_xlabel("Frequency in Hz")
     ax.set_ylabel(f"Group delay in {unit}")
     ax.grid(True, 'both')
-    _utils._set_axlim(ax, ax.set_xlim, _utils._lower_frequency_limit(signal),
-                      signal.frequencies[-1], ax.get_xlim())
+    _utils._set_axlim(ax, ax.set_xlim,
+                      _utils._lower_frequency_limit(signal, frequencies),
+                      frequencies[-1], ax.get_xlim())
     _utils._set_axlim(ax, ax.set_ylim, .5 * np.nanmin(data),
                       1.5 * np.nanmax(data), ax.get_ylim())
 
     # plot data
     if freq_scale == 'log':
-        ax.semilogx(signal.frequencies, data.T, **kwargs)
+        ax.semilogx(frequencies, data.T, **kwargs)
     else:
-        ax.plot(signal.frequencies, data.T, **kwargs)
+        ax.plot(frequencies, data.T, **kwargs)
 
     # set and format ticks
     if freq_scale == 'log':
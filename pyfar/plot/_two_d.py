@@ -1,3 +1,5 @@
+import collections
+import hashlib
 import numpy as np
 from pyfar import Signal, TimeData, FrequencyData
 import pyfar.dsp as dsp
@@ -10,6 +12,11 @@ from .ticker import (
     MultipleFractionFormatter)
 from matplotlib.ticker import NullFormatter
 
+# spectrograms of the most recently plotted signals (see _cached_spectrogram)
+_SPECTROGRAM_CACHE = collections.OrderedDict()
+_SPECTROGRAM_CACHE_SIZE = 4
+_SPECTROGRAM_CACHE_BYTES = 2**26  # 64 MiB
+
 
 def _time_2d(signal, dB, log_prefix, log_reference, unit, indices,
              orientation, method, colorbar, ax, **kwargs):
@@ -333,7 +340,7 @@ def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
     first_channel = tuple(np.zeros(len(signal.cshape), dtype='int'))
 
     # get spectrogram
-    frequencies, times, spectrogram = dsp.spectrogram(
+    frequencies, times, spectrogram = _cached_spectrogram(
         signal[first_channel], window, window_length, window_overlap_fct)
 
     # get magnitude data in dB
@@ -341,8 +348,13 @@ def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
         if log_prefix is None:
             log_prefix = _utils._log_prefix(signal)
         eps = np.finfo(float).eps
-        spectrogram = log_prefix*np.log10(
-            np.abs(spectrogram) / log_reference + eps)
+        # the spectrogram is a non-negative magnitude spectrum and a copy of
+        # the cached data. The dB values are thus computed in place without
+        # taking the absolute value
+        spectrogram /= log_reference
+        spectrogram += eps
+        np.log10(spectrogram, out=spectrogram)
+        spectrogram *= log_prefix
 
     # auto detect the time unit
     if unit in [None, "auto"]:
@@ -386,6 +398,57 @@ def _spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
     return ax[0], qm, cb
 
 
+def _cached_spectrogram(signal, window, window_length, window_overlap_fct):
+    """
+    Compute the spectrogram using pyfar.dsp.spectrogram.
+
+    The spectrograms of the ``_SPECTROGRAM_CACHE_SIZE`` most recently
+    plotted signals and parameters are cached and reused if a signal with the
+    same time data is plotted again with the same parameters, e.g., when
+    redrawing the plot through the keyboard shortcuts. The time data is
+    identified by a hash of its content. The least recently used
+    spectrograms are removed if the cache exceeds ``_SPECTROGRAM_CACHE_BYTES``
+    and spectrograms that are larger than this are not cached at all. Copies
+    of the cached data are returned because they are modified by the caller.
+    """
+
+    time = np.ascontiguousarray(signal.time)
+    key = (window, window_length, window_overlap_fct, signal.sampling_rate,
+           signal.fft_norm, time.shape, time.dtype.str,
+           hashlib.blake2b(time, digest_size=16).digest())
+    try:
+        hash(key)
+    except TypeError:
+        # window specification that can not be cached
+        key = None
+
+    cached = _SPECTROGRAM_CACHE.get(key)
+    if cached is not None:
+        _SPECTROGRAM_CACHE.move_to_end(key)
+        return tuple(data.copy() for data in cached)
+
+    frequencies, times, spectrogram = dsp.spectrogram(
+        signal, window, window_length, window_overlap_fct)
+
+    # spectrograms larger than the cache are not cached at all
+    entry = (frequencies, times, spectrogram)
+    if key is not None and \
+            sum(data.nbytes for data in entry) <= _SPECTROGRAM_CACHE_BYTES:
+        _SPECTROGRAM_CACHE[key] = entry
+        # remove the least recently used spectrograms
+        while len(_SPECTROGRAM_CACHE) > _SPECTROGRAM_CACHE_SIZE or \
+                _spectrogram_cache_bytes() > _SPECTROGRAM_CACHE_BYTES:
+            _SPECTROGRAM_CACHE.popitem(last=False)
+
+    return frequencies.copy(), times.copy(), spectrogram.copy()
+
+
+def _spectrogram_cache_bytes():
+    """Return the size of all cached spectrograms in bytes."""
+    return sum(data.nbytes for cached in _SPECTROGRAM_CACHE.values()
+               for data in cached)
+
+
 def _plot_2d(x, y, data, method, ax, **kwargs):
     # Choose method and plot
     if method == 'contourf':
@@ -1,4 +1,5 @@
 """All private utility functions of the plot module should go here."""
+import functools
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -104,20 +105,25 @@ def _set_axlim(ax, setter, low, high, limits):
         setter((min(limits[0], low), max(limits[1], high)))
 
 
-def _lower_frequency_limit(signal):
+def _lower_frequency_limit(signal, frequencies=None):
     """Return the lower frequency limit for plotting.
 
     pyfar frequency plots start at 20 Hz if data is availabe . If this is not
     the case, they start at the lowest available frequency.
+
+    The frequencies of `signal` can be passed if they are already known to
+    avoid computing them again.
     """
     if isinstance(signal, (Signal, FrequencyData)):
+        if frequencies is None:
+            frequencies = signal.frequencies
         # indices of non-zero frequencies
-        idx = np.flatnonzero(signal.frequencies)
+        idx = np.flatnonzero(frequencies)
         if len(idx) == 0:
             raise ValueError(
                 "Signals must have frequencies > 0 Hz for plotting.")
         # get the frequency limit
-        lower_frequency_limit = max(20, signal.frequencies[idx[0]])
+        lower_frequency_limit = max(20, frequencies[idx[0]])
     else:
         raise TypeError(
             'Input data has to be of type: Signal or FrequencyData.')
@@ -125,6 +131,48 @@ def _lower_frequency_limit(signal):
     return lower_frequency_limit
 
 
+def _min_max_decimation(x, data, n_bins):
+    """
+    Reduce the number of data points for plotting and keep the envelope.
+
+    The data is divided into `n_bins` bins of (almost) equal length. The
+    minimum and maximum of each bin are returned at the first and last
+    x-value of the bin.
+
+    Parameters
+    ----------
+    x : numpy array
+        The x-values of shape ``(n_points, )``.
+    data : numpy array
+        The y-values of shape ``(n_points, )`` or ``(n_points, n_lines)``.
+    n_bins : int
+        The number of bins. Must be smaller than `n_points`.
+
+    Returns
+    -------
+    x : numpy array
+        The x-values of shape ``(2 * n_bins, )``.
+    data : numpy array
+        The y-values of shape ``(2 * n_bins, )`` or
+        ``(2 * n_bins, n_lines)``.
+    """
+    # first and last index of each bin
+    start = np.linspace(0, x.size, n_bins + 1).astype(int)
+    stop = start[1:] - 1
+    start = start[:-1]
+
+    # interleave the start and stop of each bin with its minimum and maximum
+    x_decimated = np.empty(2 * n_bins, dtype=x.dtype)
+    x_decimated[::2] = x[start]
+    x_decimated[1::2] = x[stop]
+
+    data_decimated = np.empty((2 * n_bins, ) + data.shape[1:], data.dtype)
+    data_decimated[::2] = np.minimum.reduceat(data, start, axis=0)
+    data_decimated[1::2] = np.maximum.reduceat(data, start, axis=0)
+
+    return x_decimated, data_decimated
+
+
 def _return_default_colors_rgb(**kwargs):
     """Replace color in kwargs with pyfar default color if possible."""
 
@@ -424,3 +472,23 @@ def _phase_label(unwrap, deg):
         raise ValueError(f"unwrap is {unwrap} but must be True, False, or 360")
 
     return phase_label
+
+
+def _check_input_type(*audio_types):
+    """
+    Decorator raising a TypeError if the data passed to a plot function is
+    not an instance of any of the `audio_types`.
+    """
+    names = ' or '.join(audio_type.__name__ for audio_type in audio_types)
+
+    def decorator(plot_function):
+        @functools.wraps(plot_function)
+        def wrapper(signal, *args, **kwargs):
+            # comparing the type is faster than isinstance and sufficient if
+            # pyfar classes are passed
+            if type(signal) not in audio_types \
+                    and not isinstance(signal, audio_types):
+                raise TypeError(f'Input data has to be of type: {names}.')
+            return plot_function(signal, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,10 +1,13 @@
-from pyfar.plot.utils import context
+from pyfar import Signal, TimeData, FrequencyData
+from . import utils
 from . import _line
+from . import _utils
 from . import _interaction as ia
 
 
+@_utils._check_input_type(Signal, TimeData)
 def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
-         ax=None, style='light', **kwargs):
+         ax=None, style='light', decimate=False, **kwargs):
     """Plot the time signal.
 
     Plots ``signal.time`` and passes keyword arguments (`kwargs`) to
@@ -49,6 +52,13 @@ def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
         parameters, for example ``style = {'axes.facecolor':'black'}``. Pass an
         empty dictonary ``style = {}`` to use the currently active plotstyle.
         The default is ``light``.
+    decimate : bool
+        Reduce the number of plotted samples for long signals to speed up
+        plotting. If the signal has more than four times as many samples as
+        the axis is wide in pixels, only the minimum and maximum of the
+        samples that fall into each pixel are plotted. This preserves the
+        envelope of the signal but not its fine structure when zooming into
+        the plot. The default is ``False``.
     **kwargs
         Keyword arguments that are passed to ``matplotlib.pyplot.plot()``.
 
@@ -68,21 +78,15 @@ def time(signal, dB=False, log_prefix=20, log_reference=1, unit="s",
 
     """
 
-    with context(style):
-        ax = _line._time(signal.flatten(), dB, log_prefix, log_reference, unit,
-                         ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'time', dB_time=dB, log_prefix_time=log_prefix,
-        log_reference=log_reference, unit_time=unit)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax.interaction = interaction
-
-    return ax
+        log_reference=log_reference, unit_time=unit, decimate=decimate)
+    return ia._plot_with_interaction(
+        _line._time, signal, style, plot_parameter, dB, log_prefix,
+        log_reference, unit, ax, decimate, **kwargs)
 
 
+@_utils._check_input_type(Signal, FrequencyData)
 def freq(signal, dB=True, log_prefix=None, log_reference=1, freq_scale='log',
          ax=None, style='light', **kwargs):
     """
@@ -138,21 +142,15 @@ def freq(signal, dB=True, log_prefix=None, log_reference=1, freq_scale='log',
         >>> pf.plot.freq(sine)
     """
 
-    with context(style):
-        ax = _line._freq(signal.flatten(), dB, log_prefix, log_reference,
-                         freq_scale, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'freq', dB_freq=dB, log_prefix_freq=log_prefix,
         log_reference=log_reference, xscale=freq_scale)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax.interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._freq, signal, style, plot_parameter, dB, log_prefix,
+        log_reference, freq_scale, ax, **kwargs)
 
 
+@_utils._check_input_type(Signal, FrequencyData)
 def phase(signal, deg=False, unwrap=False, freq_scale='log', ax=None,
           style='light', **kwargs):
     """Plot the phase of the spectrum.
@@ -202,20 +200,14 @@ def phase(signal, deg=False, unwrap=False, freq_scale='log', ax=None,
         >>> pf.plot.phase(impulse, unwrap=True)
     """
 
-    with context(style):
-        ax = _line._phase(
-            signal.flatten(), deg, unwrap, freq_scale, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'phase', deg=deg, unwrap=unwrap, xscale=freq_scale)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax.interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._phase, signal, style, plot_parameter, deg, unwrap, freq_scale,
+        ax, **kwargs)
 
 
+@_utils._check_input_type(Signal)
 def group_delay(signal, unit="s", freq_scale='log', ax=None, style='light',
                 **kwargs):
     """Plot the group delay.
@@ -273,20 +265,14 @@ def group_delay(signal, unit="s", freq_scale='log', ax=None, style='light',
         >>> pf.plot.group_delay(impulse, unit='samples')
     """
 
-    with context(style):
-        ax = _line._group_delay(
-            signal.flatten(), unit, freq_scale, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'group_delay', unit_gd=unit, xscale=freq_scale)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax.interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._group_delay, signal, style, plot_parameter, unit, freq_scale,
+        ax, **kwargs)
 
 
+@_utils._check_input_type(Signal)
 def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
               log_prefix_freq=None, log_reference=1, freq_scale='log',
               unit="s", ax=None, style='light', **kwargs):
@@ -364,23 +350,17 @@ def time_freq(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
         >>> pf.plot.time_freq(sine, unit='ms')
     """
 
-    with context(style):
-        ax = _line._time_freq(signal.flatten(), dB_time, dB_freq,
-                              log_prefix_time, log_prefix_freq,
-                              log_reference, freq_scale, unit, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'time_freq', dB_time=dB_time, dB_freq=dB_freq,
         log_prefix_time=log_prefix_time, log_prefix_freq=log_prefix_freq,
         log_reference=log_reference, xscale=freq_scale, unit_time=unit)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax[0].interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._time_freq, signal, style, plot_parameter, dB_time, dB_freq,
+        log_prefix_time, log_prefix_freq, log_reference, freq_scale, unit,
+        ax, **kwargs)
 
 
+@_utils._check_input_type(Signal, FrequencyData)
 def freq_phase(signal, dB=True, log_prefix=None, log_reference=1,
                freq_scale='log', deg=False, unwrap=False, ax=None,
                style='light', **kwargs):
@@ -441,22 +421,16 @@ def freq_phase(signal, dB=True, log_prefix=None, log_reference=1,
         >>> pf.plot.freq_phase(impulse, unwrap=True)
     """
 
-    with context(style):
-        ax = _line._freq_phase(signal.flatten(), dB, log_prefix, log_reference,
-                               freq_scale, deg, unwrap, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'freq_phase', dB_freq=dB, log_prefix_freq=log_prefix,
         log_reference=log_reference, xscale=freq_scale, deg=deg,
         unwrap=unwrap)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax[0].interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._freq_phase, signal, style, plot_parameter, dB, log_prefix,
+        log_reference, freq_scale, deg, unwrap, ax, **kwargs)
 
 
+@_utils._check_input_type(Signal)
 def freq_group_delay(signal, dB=True, log_prefix=None, log_reference=1,
                      unit="s", freq_scale='log', ax=None, style='light',
                      **kwargs):
@@ -525,22 +499,15 @@ def freq_group_delay(signal, dB=True, log_prefix=None, log_reference=1,
         >>> pf.plot.freq_group_delay(impulse, unit='samples')
     """
 
-    with context(style):
-        ax = _line._freq_group_delay(
-            signal.flatten(), dB, log_prefix, log_reference,
-            unit, freq_scale, ax, **kwargs)
-
-    # manage interaction
     plot_parameter = ia.PlotParameter(
         'freq_group_delay', dB_freq=dB, log_prefix_freq=log_prefix,
         log_reference=log_reference, unit_gd=unit, xscale=freq_scale)
-    interaction = ia.Interaction(
-        signal, ax, None, style, plot_parameter, **kwargs)
-    ax[0].interaction = interaction
-
-    return ax
+    return ia._plot_with_interaction(
+        _line._freq_group_delay, signal, style, plot_parameter, dB, log_prefix,
+        log_reference, unit, freq_scale, ax, **kwargs)
 
 
+@_utils._check_input_type(Signal)
 def custom_subplots(signal, plots, ax=None, style='light', **kwargs):
     """
     Plot multiple pyfar plots with a custom layout and default parameters.
@@ -589,7 +556,7 @@ def custom_subplots(signal, plots, ax=None, style='light', **kwargs):
 
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax = _line._custom_subplots(signal.flatten(), plots, ax, **kwargs)
 
     return ax
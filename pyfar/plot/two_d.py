@@ -1,5 +1,5 @@
 import numpy as np
-from pyfar.plot.utils import context
+from . import utils
 from .. import Signal
 from . import _two_d
 from . import _interaction as ia
@@ -129,7 +129,7 @@ def time_2d(signal, dB=False, log_prefix=None, log_reference=1, unit="s",
         >>> pf.plot.time_2d(impulses, unit='ms')
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._time_2d(
             signal, dB, log_prefix, log_reference, unit,
             indices, orientation, method, colorbar, ax, **kwargs)
@@ -261,7 +261,7 @@ def freq_2d(signal, dB=True, log_prefix=None, log_reference=1,
         >>> pf.plot.freq_2d(impulses, dB=False)
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._freq_2d(
             signal, dB, log_prefix, log_reference, freq_scale, indices,
             orientation, method, colorbar, ax, **kwargs)
@@ -388,7 +388,7 @@ def phase_2d(signal, deg=False, unwrap=False, freq_scale='log', indices=None,
         >>> pf.plot.phase_2d(impulses, unwrap=True, freq_scale="linear")
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._phase_2d(
             signal, deg, unwrap, freq_scale, indices, orientation, method,
             colorbar, ax, **kwargs)
@@ -523,7 +523,7 @@ def group_delay_2d(signal, unit="s", freq_scale='log', indices=None,
         >>> pf.plot.group_delay_2d(impulses, unit="samples")
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._group_delay_2d(
             signal, unit, freq_scale, indices, orientation, method,
             colorbar, ax, **kwargs)
@@ -674,7 +674,7 @@ def time_freq_2d(signal, dB_time=False, dB_freq=True, log_prefix_time=20,
         >>> pf.plot.time_freq_2d(impulses, dB_freq=False, unit='ms')
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._time_freq_2d(
             signal, dB_time, dB_freq, log_prefix_time, log_prefix_freq,
             log_reference, freq_scale, unit, indices, orientation, method,
@@ -813,7 +813,7 @@ def freq_phase_2d(signal, dB=True, log_prefix=None, log_reference=1,
         ...                       freq_scale="linear")
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._freq_phase_2d(
             signal, dB, log_prefix, log_reference, freq_scale, deg, unwrap,
             indices, orientation, method, colorbar, ax, **kwargs)
@@ -957,7 +957,7 @@ def freq_group_delay_2d(signal, dB=True, log_prefix=None, log_reference=1,
         >>> pf.plot.freq_group_delay_2d(impulses, dB=False, unit="samples")
     """
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._freq_group_delay_2d(
             signal, dB, log_prefix, log_reference, unit, freq_scale, indices,
             orientation, method, colorbar, ax, **kwargs)
@@ -1088,7 +1088,7 @@ def spectrogram(signal, dB=True, log_prefix=None, log_reference=1,
     if not isinstance(signal, Signal):
         raise TypeError('Input data has to be of type: Signal.')
 
-    with context(style):
+    with utils._style_context(style):
         ax, qm, cb = _two_d._spectrogram(
             signal.flatten(), dB, log_prefix, log_reference, freq_scale, unit,
             window, window_length, window_overlap_fct, colorbar, ax, **kwargs)
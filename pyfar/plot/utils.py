@@ -1,7 +1,9 @@
+import matplotlib as mpl
 import matplotlib.style as mpl_style
 import os
 import json
 import contextlib
+import functools
 from . import _utils
 from pyfar.plot._interaction import PlotParameter
 
@@ -31,8 +33,36 @@ def plotstyle(style='light'):
     """
 
     if style in ['light', 'dark']:
-        style = os.path.join(
-            os.path.dirname(__file__), 'plotstyles', f'{style}.mplstyle')
+        style = _plotstyle_path(style)
+
+    return style
+
+
+@functools.lru_cache(maxsize=None)
+def _plotstyle_path(style):
+    """Return the full path of the pyfar plotstyle `style`."""
+    return os.path.join(
+        os.path.dirname(__file__), 'plotstyles', f'{style}.mplstyle')
+
+
+@functools.lru_cache(maxsize=None)
+def _plotstyle_params(style):
+    """
+    Return the rcParams of the pyfar plotstyle `style`.
+
+    The mplstyle file is parsed only once and the result is reused for all
+    following calls. The returned rcParams must not be modified.
+    """
+    return mpl.rc_params_from_file(
+        _plotstyle_path(style), use_default_template=False)
+
+
+def _style_params(style):
+    """
+    Return cached rcParams for the pyfar plotstyles and `style` otherwise.
+    """
+    if isinstance(style, str) and style in ['light', 'dark']:
+        style = _plotstyle_params(style)
 
     return style
 
@@ -84,13 +114,37 @@ def context(style='light', after_reset=False):
     """
 
     # get pyfar plotstyle if desired
-    style = plotstyle(style)
+    style = _style_params(style)
 
     # apply plot style
     with mpl_style.context(style):
         yield
 
 
+def _style_is_applied(style):
+    """
+    Return ``True`` if all rcParams of the pyfar plotstyle `style` are in
+    effect and ``False`` otherwise.
+    """
+    return all(mpl.rcParams[key] == value
+               for key, value in _plotstyle_params(style).items())
+
+
+@contextlib.contextmanager
+def _style_context(style):
+    """
+    Context manager applying `style` unless it is a pyfar plotstyle whose
+    rcParams are all in effect already. Applying the style would not change
+    any rcParams in this case.
+    """
+    if isinstance(style, str) and style in ['light', 'dark'] \
+            and _style_is_applied(style):
+        yield
+    else:
+        with context(style):
+            yield
+
+
 def use(style="light"):
     """
     Use plot style settings from a style specification.
@@ -141,7 +195,7 @@ def use(style="light"):
     """
 
     # get pyfar plotstyle if desired
-    style = plotstyle(style)
+    style = _style_params(style)
     # use plot style
     mpl_style.use(style)
 
@@ -11,6 +11,7 @@ Test deprecations. For each deprecation two things must be tested:
 
 """
 import numpy as np
+import matplotlib.pyplot as plt
 from packaging import version
 import re
 
@@ -22,39 +23,60 @@ from pyfar.classes.warnings import PyfarDeprecationWarning
 # This defines the plot size and the backend
 from pyfar.testing.plot_utils import create_figure
 
+_PF_VERSION = version.parse(pf.__version__)
+_V_060 = version.parse('0.6.0')
+_V_080 = version.parse('0.8.0')
+
+
+@pytest.fixture(scope='module')
+def shared_figure():
+    """Figure that is shared by all plot tests of this module."""
+    fig = create_figure()
+    yield fig
+    plt.close(fig)
+
+
+@pytest.fixture
+def figure(shared_figure):
+    """Activate and clear the shared figure before each plot test."""
+    plt.figure(shared_figure.number)
+    shared_figure.clf()
+    return shared_figure
+
 
 # deprecate in 0.6.0 ----------------------------------------------------------
+removed_in_0_6_0 = pytest.mark.skipif(
+    _PF_VERSION < _V_060, reason='Removed in pyfar 0.6.0')
+
+
+@removed_in_0_6_0
 @pytest.mark.parametrize('function', [
     (pf.plot.freq), (pf.plot.phase), (pf.plot.group_delay),
     (pf.plot.time_freq), (pf.plot.freq_phase), (pf.plot.freq_group_delay)])
-def test_xscale_deprecation(function, handsome_signal):
+def test_xscale_deprecation(function, handsome_signal, figure):
     """Deprecate xscale parameter in plot functions"""
 
-    if version.parse(pf.__version__) >= version.parse('0.6.0'):
-        with pytest.raises(AttributeError):
-            # remove xscale from pyfar 0.6.0!
-            create_figure()
-            function(handsome_signal, xscale='linear')
+    with pytest.raises(AttributeError):
+        # remove xscale from pyfar 0.6.0!
+        function(handsome_signal, xscale='linear')
 
 
-def test_spectrogram_yscale_deprecation(sine):
+@removed_in_0_6_0
+def test_spectrogram_yscale_deprecation(sine, figure):
     """Deprecate yscale parameter in plot functions"""
 
-    if version.parse(pf.__version__) >= version.parse('0.6.0'):
-        with pytest.raises(AttributeError):
-            # remove yscale from pyfar 0.6.0!
-            create_figure()
-            pf.plot.spectrogram(sine, yscale='linear')
+    with pytest.raises(AttributeError):
+        # remove yscale from pyfar 0.6.0!
+        pf.plot.spectrogram(sine, yscale='linear')
 
 
+@removed_in_0_6_0
 def test__check_time_unit():
     """Deprecate unit=None in plots showing the time or group delay"""
 
-    if version.parse(pf.__version__) >= version.parse('0.6.0'):
-        with pytest.raises(ValueError):
-            # remove xscale from pyfar 0.6.0!
-            create_figure()
-            pf.plot._utils._check_time_unit(None)
+    with pytest.raises(ValueError):
+        # remove xscale from pyfar 0.6.0!
+        pf.plot._utils._check_time_unit(None)
 
 
 # deprecate in 0.8.0 ----------------------------------------------------------
@@ -63,40 +85,46 @@ def test_pad_zero_modi():
                       match='Mode "before" and "after" will be renamed into'):
         pf.dsp.pad_zeros(pf.Signal([1], 44100), 5, 'before')
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(ValueError):
             # remove mode 'before' and 'after' from pyfar 0.8.0!
             pf.dsp.pad_zeros(pf.Signal([1], 44100), 5, mode='before')
 
 
 # deprecate in 0.8.0 ----------------------------------------------------------
+_STATEMENTS_0_8_0 = (
+    'coords.get_cart()',
+    'coords.sh_order',
+    'coords.set_cart(1,1,1)',
+    'coords.get_cyl()',
+    'coords.set_cyl(1,1,1)',
+    'coords.get_sph()',
+    'coords.set_sph(1,1,1)',
+    'coords.systems()',
+    'pf.Coordinates(0, 0, 0, sh_order=1)',
+    "pf.Coordinates(0, 0, 0, domain='sph')",
+    "pf.Coordinates(0, 0, 0, domain='sph', unit='deg')",
+    "pf.Coordinates(0, 0, 0, domain='sph', convention='top_colat')",
+    "pf.samplings.cart_equidistant_cube(2)",
+    "pf.samplings.sph_dodecahedron()",
+    "pf.samplings.sph_icosahedron()",
+    "pf.samplings.sph_equiangular(sh_order=5)",
+    "pf.samplings.sph_gaussian(sh_order=5)",
+    "pf.samplings.sph_extremal(sh_order=5)",
+    "pf.samplings.sph_t_design(sh_order=5)",
+    "pf.samplings.sph_equal_angle(5)",
+    "pf.samplings.sph_great_circle()",
+    "pf.samplings.sph_lebedev(sh_order=5)",
+    "pf.samplings.sph_fliege(sh_order=5)",
+    "pf.samplings.sph_equal_area(5)",
+)
+
+
 @pytest.mark.parametrize(
-    'statement', [
-        ('coords.get_cart()'),
-        ('coords.sh_order'),
-        ('coords.set_cart(1,1,1)'),
-        ('coords.get_cyl()'),
-        ('coords.set_cyl(1,1,1)'),
-        ('coords.get_sph()'),
-        ('coords.set_sph(1,1,1)'),
-        ('coords.systems()'),
-        ('pf.Coordinates(0, 0, 0, sh_order=1)'),
-        ("pf.Coordinates(0, 0, 0, domain='sph')"),
-        ("pf.Coordinates(0, 0, 0, domain='sph', unit='deg')"),
-        ("pf.Coordinates(0, 0, 0, domain='sph', convention='top_colat')"),
-        ("pf.samplings.cart_equidistant_cube(2)"),
-        ("pf.samplings.sph_dodecahedron()"),
-        ("pf.samplings.sph_icosahedron()"),
-        ("pf.samplings.sph_equiangular(sh_order=5)"),
-        ("pf.samplings.sph_gaussian(sh_order=5)"),
-        ("pf.samplings.sph_extremal(sh_order=5)"),
-        ("pf.samplings.sph_t_design(sh_order=5)"),
-        ("pf.samplings.sph_equal_angle(5)"),
-        ("pf.samplings.sph_great_circle()"),
-        ("pf.samplings.sph_lebedev(sh_order=5)"),
-        ("pf.samplings.sph_fliege(sh_order=5)"),
-        ("pf.samplings.sph_equal_area(5)"),
-    ])
+    'statement',
+    [compile(statement, '<deprecation>', 'eval')
+     for statement in _STATEMENTS_0_8_0],
+    ids=_STATEMENTS_0_8_0)
 def test_deprecations_0_8_0(statement):
     coords = pf.Coordinates.from_spherical_colatitude(np.arange(6), 0, 0)
     coords.y = 1
@@ -112,7 +140,7 @@ def test_deprecations_0_8_0(statement):
         eval(statement)
 
     # remove statement from pyfar 0.8.0!
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(AttributeError):
             eval(statement)
 
@@ -130,7 +158,7 @@ def test_deprecations_0_8_0_set_sh_order():
         coords.sh_order = 1
 
     # remove statement from pyfar 0.8.0!
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(AttributeError):
             coords.sh_order = 1
 
@@ -140,7 +168,7 @@ def test_signal_len():
                       match=re.escape("len(Signal) will be deprecated")):
         len(pf.Signal([1, 2, 3], 44100))
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(TypeError, match=re.escape("had no len()")):
             # remove Signal.__len__ from pyfar 0.8.0!
             len(pf.Signal([1, 2, 3], 44100))
@@ -154,7 +182,7 @@ def test_deprecations_find_nearest_k():
             match="This function will be deprecated in pyfar 0.8.0 in favor"):
         coords.find_nearest_k(1, 0, 0)
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(TypeError):
             coords.find_nearest_k(1, 0, 0)
 
@@ -167,7 +195,7 @@ def test_deprecations_find_slice():
             match="This function will be deprecated in pyfar 0.8.0. Use "):
         coords.find_slice('elevation', 'deg', 0, 5)
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(TypeError):
             coords.find_slice('elevation', 'deg', 0, 5)
 
@@ -180,7 +208,7 @@ def test_deprecations_find_nearest_cart():
             match="This function will be deprecated in pyfar 0.8.0 in favor "):
         coords.find_nearest_cart(1, 1, 1, 1)
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(TypeError):
             coords.find_nearest_cart(1, 1, 1, 1)
 
@@ -193,6 +221,6 @@ def test_deprecations_find_nearest_sph():
             match="This function will be deprecated in pyfar 0.8.0 in favor "):
         coords.find_nearest_sph(1, 1, 1, 1)
 
-    if version.parse(pf.__version__) >= version.parse('0.8.0'):
+    if _PF_VERSION >= _V_080:
         with pytest.raises(TypeError):
             coords.find_nearest_sph(1, 1, 1, 1)
@@ -4,6 +4,7 @@ import pytest
 from pytest import raises
 import numpy as np
 import numpy.testing as npt
+import scipy.signal as sgn
 
 
 def test_assertions(sine):
@@ -18,6 +19,13 @@ def test_assertions(sine):
     with raises(TypeError, match="The normalize parameter"):
         spectrogram(sine, normalize=1)
 
+    with raises(ValueError, match="window_overlap_fct must be smaller"):
+        spectrogram(sine, window_overlap_fct=1)
+
+    # unhashable window specifications are passed to scipy
+    with raises(ValueError):
+        spectrogram(sine, window=['kaiser', 8])
+
 
 def test_return_values():
     """Test return values of the spectrogram with default parameters"""
@@ -36,6 +44,22 @@ def test_return_values():
     npt.assert_allclose(spectro[257:, 1], 0, atol=1e-13)
 
 
+def test_scipy_reference(sine):
+    """Test against scipy.signal.spectrogram"""
+    window = sgn.get_window('hann', 1024)
+    freqs_scipy, times_scipy, spectro_scipy = sgn.spectrogram(
+        sine.time[0], sine.sampling_rate, window=window, noverlap=512,
+        mode='magnitude', scaling='spectrum')
+    # remove normalization from scipy
+    spectro_scipy *= window.sum()
+
+    freqs, times, spectro = spectrogram(sine, normalize=False)
+
+    npt.assert_allclose(freqs, freqs_scipy)
+    npt.assert_allclose(times, times_scipy - times_scipy[0], atol=1e-15)
+    npt.assert_allclose(spectro, spectro_scipy, atol=1e-12)
+
+
 @pytest.mark.parametrize('window,value', [
     ('rect', [0, 1, 0]),         # rect window does not spread energy
     ('hann', [.5, 1, .5])])      # hann window spreads energy
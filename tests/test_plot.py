@@ -655,3 +655,89 @@ def test_set_specific_plot_parameters():
         facecolor = mcolors.to_hex(plt.gca().patch.get_facecolor())
         assert facecolor == '#000000'  # #000000 is hex for black
     plt.close('all')
+
+
+def test_style_context_applies_overridden_style():
+    """
+    Test if the pyfar plot style is applied again if its rcParams are not in
+    effect anymore.
+    """
+    light = pf.plot.utils._plotstyle_params("light")
+    with pf.plot.context("light"):
+        assert pf.plot.utils._style_is_applied("light")
+        assert not pf.plot.utils._style_is_applied("dark")
+        with plt.style.context("dark_background"):
+            assert not pf.plot.utils._style_is_applied("light")
+            ax = pf.plot.time(pf.TimeData([0, 1, 0, -1], range(4)))
+            facecolor = mcolors.to_hex(ax.patch.get_facecolor())
+            assert facecolor == mcolors.to_hex(light['axes.facecolor'])
+    plt.close('all')
+
+
+def test_spectrogram_cache(sine):
+    """Test if cached spectrograms are reused and updated on changed data."""
+    cache = pf.plot._two_d._SPECTROGRAM_CACHE
+    cache.clear()
+    desired = pf.dsp.spectrogram(sine)
+
+    # first call computes, second call uses the cache
+    for nn in range(2):
+        actual = pf.plot._two_d._cached_spectrogram(sine, 'hann', 1024, .5)
+        for a, d in zip(actual, desired):
+            npt.assert_equal(a, d)
+        # the cached entry is reused
+        assert len(cache) == 1
+        if nn:
+            assert next(iter(cache.values())) is entry
+        entry = next(iter(cache.values()))
+        # changing the returned data must not change the cached data
+        actual[2][:] = 0
+
+    # changed time data must not return the cached spectrogram
+    sine.time = 2 * sine.time
+    actual = pf.plot._two_d._cached_spectrogram(sine, 'hann', 1024, .5)
+    npt.assert_allclose(actual[2], 2 * desired[2])
+
+
+def test_spectrogram_cache_multiple_signals(sine, noise):
+    """Test if spectrograms of different signals are cached separately."""
+    pf.plot._two_d._SPECTROGRAM_CACHE.clear()
+    for signal in [sine, noise, sine]:
+        pf.plot._two_d._cached_spectrogram(signal, 'hann', 1024, .5)
+    assert len(pf.plot._two_d._SPECTROGRAM_CACHE) == 2
+
+
+def test_spectrogram_cache_large_signal(sine, noise, monkeypatch):
+    """Test if spectrograms larger than the cache are not cached."""
+    cache = pf.plot._two_d._SPECTROGRAM_CACHE
+    cache.clear()
+    pf.plot._two_d._cached_spectrogram(sine, 'hann', 1024, .5)
+    n_bytes = pf.plot._two_d._spectrogram_cache_bytes()
+    monkeypatch.setattr(pf.plot._two_d, '_SPECTROGRAM_CACHE_BYTES',
+                        2 * n_bytes)
+
+    pf.plot._two_d._cached_spectrogram(noise, 'hann', 1024, .5)
+    assert len(cache) == 2
+    # the large spectrogram neither is cached nor removes cached ones
+    large = pf.signals.noise(10 * sine.n_samples, seed=1)
+    pf.plot._two_d._cached_spectrogram(large, 'hann', 1024, .5)
+    assert len(cache) == 2
+    assert pf.plot._two_d._spectrogram_cache_bytes() == 2 * n_bytes
+
+
+@pytest.mark.parametrize('function, data', [
+    (plot.time, pf.FrequencyData([1, 2], [1, 2])),
+    (plot.freq, pf.TimeData([1, 2], [0, 1])),
+    (plot.phase, pf.TimeData([1, 2], [0, 1])),
+    (plot.group_delay, pf.FrequencyData([1, 2], [1, 2])),
+    (plot.time_freq, pf.TimeData([1, 2], [0, 1])),
+    (plot.freq_phase, [1, 2]),
+    (plot.freq_group_delay, pf.FrequencyData([1, 2], [1, 2])),
+    (plot.custom_subplots, pf.TimeData([1, 2], [0, 1]))])
+def test_line_plot_input_type(function, data):
+    """Test if the line plots raise an error for invalid input types."""
+    with raises(TypeError, match="Input data has to be of type: Signal"):
+        if function == plot.custom_subplots:
+            function(data, [plot.time])
+        else:
+            function(data)
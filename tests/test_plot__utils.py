@@ -1,4 +1,6 @@
 import matplotlib.pyplot as plt
+import numpy as np
+import numpy.testing as npt
 import pytest
 from pytest import raises
 import pyfar.plot as plot
@@ -141,3 +143,27 @@ def test__deal_time_units_mus():
     """Test previous bugfix for unit micro seconds in labels."""
     s = pf.signals.impulse(10, sampling_rate=44100)
     pf.plot.time(s)
+
+
+def test__min_max_decimation():
+    """Test returned envelope for multichannel data."""
+    x = np.arange(10)
+    data = np.array([[0, 2, 1, 5, 4, 3, 9, 6, 8, 7],
+                     [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]]).T
+    x_dec, data_dec = plot._utils._min_max_decimation(x, data, 2)
+
+    npt.assert_equal(x_dec, [0, 4, 5, 9])
+    npt.assert_equal(data_dec, [[0, 1], [5, 1], [3, 1], [9, 1]])
+
+
+def test_time_decimate():
+    """Test number of plotted samples with and without decimation."""
+    signal = pf.signals.noise(100000)
+    plt.close('all')
+    ax = pf.plot.time(signal, decimate=False)
+    assert ax.lines[0].get_xdata().size == signal.n_samples
+    plt.close('all')
+    ax = pf.plot.time(signal, decimate=True)
+    assert ax.lines[0].get_xdata().size == 2 * int(np.ceil(ax.bbox.width))
+    assert ax.interaction.params.decimate
+    plt.close('all')